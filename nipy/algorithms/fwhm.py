@@ -55,6 +55,8 @@ class Resels(object):
         self.normalized = normalized
         _transform = self.coordmap.affine
         self.wedge = np.power(np.fabs(det(_transform)), 1./self.D)
+        # Constant factor of the resel <-> FWHM conversions
+        self._r2f_const = np.sqrt(4*np.log(2.)) * self.wedge
 
     def integrate(self, mask=None):
         """
@@ -92,7 +94,7 @@ class Resels(object):
         
         :Returns: FWHM
         """
-        return np.sqrt(4*np.log(2.)) * self.wedge * pos_recipr(np.power(resels, 1./self.D))
+        return self._r2f_const * pos_recipr(np.power(resels, 1./self.D))
 
     def fwhm2resel(self, fwhm):
         """
@@ -104,7 +106,7 @@ class Resels(object):
 
         :Returns: resels
         """
-        return pos_recipr(np.power(fwhm / np.sqrt(4*np.log(2)) * self.wedge, self.D))
+        return pos_recipr(np.power(fwhm / self._r2f_const, self.D))
 
     def __iter__(self):
         """
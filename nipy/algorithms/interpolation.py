@@ -19,7 +19,7 @@ class ImageInterpolator(object):
     The resampling is done with scipy.ndimage.
     """
 
-    def __init__(self, image, order=3):
+    def __init__(self, image, order=3, dtype=np.float64):
         """
         Parameters
         ----------
@@ -27,39 +27,42 @@ class ImageInterpolator(object):
            Image to be interpolated
         order : int
            order of spline interpolation as used in scipy.ndimage
+        dtype : numpy dtype
+           floating point type in which the spline coefficients are
+           stored; np.float32 halves the memory read by evaluate
         """
+        # set first, so that __del__ works if anything below raises
+        self._datafile = None
         self.image = image
         self.order = order
-        self._datafile = None
+        self.dtype = np.dtype(dtype)
+        # world to voxel map, built once rather than on every evaluate
+        self._inverse = image.coordmap.inverse
         self._buildknots()
 
     def _buildknots(self):
-        if self.order > 1:
-            data = ndimage.spline_filter(
-                np.nan_to_num(np.asarray(self.image)),
-                self.order)
-        else:
-            data = np.nan_to_num(np.asarray(self.image))
         if self._datafile is None:
-            _, fname = tempfile.mkstemp()
-            self._datafile = file(fname, mode='wb')
-        else:
-            self._datafile = file(self._datafile.name, 'wb')
-        data = np.nan_to_num(data.astype(np.float64))
-        data.tofile(self._datafile)
-        datashape = data.shape
-        dtype = data.dtype
-        del(data)
-        self._datafile.close()
-        self._datafile = file(self._datafile.name)
-        self.data = np.memmap(self._datafile.name, dtype=dtype,
-                              mode='r+', shape=datashape)
+            fd, self._datafile = tempfile.mkstemp()
+            # np.memmap opens the file itself
+            os.close(fd)
+        # Fill and spline filter the memmap in place, rather than
+        # building the coefficients in memory and writing them to disk
+        data = np.memmap(self._datafile, dtype=self.dtype,
+                         mode='w+', shape=self.image.shape)
+        data[:] = np.asarray(self.image)
+        _nan_to_num(data)
+        if self.order > 1:
+            ndimage.spline_filter(data, self.order, output=data)
+            _nan_to_num(data)
+        data.flush()
+        self.data = data
 
     def __del__(self):
         if self._datafile:
-            self._datafile.close()
+            # release the mapping before removing the file backing it
+            self.data = None
             try:
-                os.remove(self._datafile.name)
+                os.remove(self._datafile)
             except:
                 pass
 
@@ -74,10 +77,11 @@ class ImageInterpolator(object):
         V: ndarray
            interpolator of self.image evaluated at points
         """
-        points = np.array(points, np.float64)
+        # No copy if points already has the dtype of the coefficients
+        points = np.asarray(points, self.dtype)
         output_shape = points.shape[1:]
-        points.shape = (points.shape[0], np.product(output_shape))
-        voxels = self.image.coordmap.inverse(points.T).T
+        points = points.reshape((points.shape[0], -1))
+        voxels = self._inverse(points.T).T
         V = ndimage.map_coordinates(self.data, 
                                      voxels,
                                      order=self.order,
@@ -86,3 +90,12 @@ class ImageInterpolator(object):
         # it needs to be reshaped to the original shape
         V.shape = output_shape
         return V
+
+
+def _nan_to_num(data):
+    """
+    In place version of np.nan_to_num for a float array
+    """
+    data[np.isnan(data)] = 0
+    maxf = np.finfo(data.dtype).max
+    np.clip(data, -maxf, maxf, out=data)
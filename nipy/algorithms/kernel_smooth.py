@@ -3,7 +3,6 @@ TODO
 """
 __docformat__ = 'restructuredtext'
 
-import gc
 
 import numpy as np
 import numpy.fft as fft
@@ -52,7 +51,7 @@ class LinearFilter(object):
         center = np.asarray(self.bshape)/2
         center = self.coordmap([center[i] for i in range(len(self.bshape))])
 
-        voxels.shape = (voxels.shape[0], np.product(voxels.shape[1:]))
+        voxels.shape = (voxels.shape[0], np.prod(voxels.shape[1:]))
         X = (self.coordmap(voxels.T) - center).T
         X.shape = (self.coordmap.ndim[0],) + tuple(self.bshape)
         kernel = self(X)
@@ -135,7 +134,6 @@ class LinearFilter(object):
 
             data = fft.irfftn(data) / self.norms[self.normalization]
 
-            gc.collect()
             _dslice = [slice(0, self.bshape[i], 1) for i in range(3)]
             if self.scale != 1:
                 data = self.scale * data[_dslice]
@@ -143,8 +141,6 @@ class LinearFilter(object):
             if self.location != 0.0:
                 data += self.location
 
-            gc.collect()
-
             # Write out data 
 
             if inimage.ndim == 4:
@@ -153,7 +149,6 @@ class LinearFilter(object):
                 _out = data
             _slice += 1
 
-        gc.collect()
         _out = _out[[slice(self._kernel.shape[i]/2, self.bshape[i] +
                            self._kernel.shape[i]/2) for i in range(len(self.bshape))]]
         if inimage.ndim == 3:
@@ -3,8 +3,6 @@ TODO
 """
 __docformat__ = 'restructuredtext'
 
-import gc
-
 import numpy as np
 from nipy.fixes.scipy.stats.models.utils import pos_recipr
 
@@ -33,19 +31,26 @@ def estimate_mean(Y, sd):
         Y = Y.reshape(Y.shape[0], 1)
         squeeze = True
 
-    _stretch = lambda x: np.multiply.outer(np.ones(nsubject), x)
-
+    # Compute the mean using the optimal weights.  A single weight for
+    # all entries is kept as a scalar, rather than expanded to Y.shape
     W = pos_recipr(sd**2)
-    if W.shape in [(), (1,)]:
-        W = np.ones(Y.shape) * W
-    W.shape = Y.shape
-
-    # Compute the mean using the optimal weights
-    effect = (Y * W).sum(0) / W.sum(0)
-    resid = (Y - _stretch(effect)) * np.sqrt(W)
-
-    scale = np.add.reduce(np.power(resid, 2), 0) / (nsubject - 1)
-    var_total = scale * pos_recipr(W.sum(0))
+    scalar_W = W.shape in [(), (1,)]
+    if scalar_W:
+        W = W.reshape(())
+        sumW = W * nsubject
+        effect = Y.sum(0) * W / sumW
+    else:
+        W.shape = Y.shape
+        sumW = W.sum(0)
+        effect = (Y * W).sum(0) / sumW
+
+    # effect broadcasts against Y along the subject axis
+    resid = Y - effect
+    if not scalar_W or W != 1:
+        resid *= np.sqrt(W)
+
+    scale = (resid**2).sum(0) / (nsubject - 1)
+    var_total = scale * pos_recipr(sumW)
 
     value = {}
     value['resid'] = resid        
@@ -96,7 +101,6 @@ def estimate_varatio(Y, sd, df=None, niter=10):
     if Y.ndim == 1:
         Y = Y.reshape(Y.shape[0], 1)
         squeeze = True
-    _stretch = lambda x: np.multiply.outer(np.ones(nsubject), x)
 
     W = pos_recipr(sd**2)
     if W.shape in [(), (1,)]:
@@ -104,21 +108,34 @@ def estimate_varatio(Y, sd, df=None, niter=10):
     W.shape = Y.shape
 
     S = 1. / W
-    R = Y - np.multiply.outer(np.ones(Y.shape[0]), Y.mean(0))
+    # Arrays over voxels broadcast against the subject axis of Y
+    R = Y - Y.mean(0)
     sigma2 = np.squeeze((R**2).sum(0)) / (nsubject - 1)
 
     Sreduction = 0.99
     minS = S.min(0) * Sreduction
-    Sm = S - _stretch(minS)
+    Sm = S - minS
+
+    # Work arrays of the shape of Y, filled in place on each iteration
+    Sms = np.empty(Y.shape)
+    W = np.empty(Y.shape)
+    tmp = np.empty(Y.shape)
 
     for _ in range(niter):
-        Sms = Sm + _stretch(sigma2)
-        W = pos_recipr(Sms)
+        np.add(Sm, sigma2, Sms)
+        # positive reciprocal of Sms, zero where Sms <= 0
+        np.divide(1., Sms, W)
+        W[Sms <= 0] = 0
         Winv = pos_recipr(W.sum(0))
-        mu = Winv * (W*Y).sum(0)
-        R = W * (Y - _stretch(mu))
-        ptrS = 1 + (Sm * W).sum(0) - (Sm * W**2).sum(0) * Winv
-        sigma2 = np.squeeze((sigma2 * ptrS + (sigma2**2) * (R**2).sum(0)) / nsubject)
+        mu = Winv * np.multiply(W, Y, tmp).sum(0)
+        np.subtract(Y, mu, R)
+        R *= W
+        np.multiply(Sm, W, tmp)
+        ptrS = 1 + tmp.sum(0)
+        tmp *= W
+        ptrS -= tmp.sum(0) * Winv
+        np.multiply(R, R, tmp)
+        sigma2 = np.squeeze((sigma2 * ptrS + (sigma2**2) * tmp.sum(0)) / nsubject)
     sigma2 = sigma2 - minS
 
     if df is None:
@@ -127,7 +144,7 @@ def estimate_varatio(Y, sd, df=None, niter=10):
     df.shape = (1, nsubject)
         
     _Sshape = S.shape
-    S.shape = (S.shape[0], np.product(S.shape[1:]))
+    S.shape = (S.shape[0], -1)
 
     value = {}
     value['fixed'] = (np.dot(df, S) / df.sum()).reshape(_Sshape[1:])
@@ -173,8 +173,7 @@ class AREstimator:
             `results` : a scipy.stats.models.model.LikelihoodModelResults instance
         :Returns: ``numpy.ndarray``
         """
-        resid = results.resid.reshape((results.resid.shape[0],
-                                       np.product(results.resid.shape[1:])))
+        resid = results.resid.reshape((results.resid.shape[0], -1))
 
         sum_sq = results.scale.reshape(resid.shape[1:]) * results.df_resid
 
@@ -52,7 +52,7 @@ def elsym(edgelen, order=1):
         return 1
     r = 0
     for v in utils.combinations(range(l), order):
-        r += np.product([edgelen[vv] for vv in v])
+        r += np.prod([edgelen[vv] for vv in v])
     return r
 
 
@@ -135,7 +135,7 @@ def test_lips1_disjoint():
     d = np.random.standard_normal((10,)+(30,))
 
     U = randorth(p=6)[:1]
-    e = np.dot(U.T, c.reshape((c.shape[0], np.product(c.shape[1:]))))
+    e = np.dot(U.T, c.reshape((c.shape[0], -1)))
     e.shape = (e.shape[0],) +  c.shape[1:]
 
     yield assert_almost_equal, phi(c, box1 + box2), \
@@ -159,7 +159,7 @@ def test_lips2_disjoint():
     d = np.random.standard_normal((40,40,40))
 
     U = randorth(p=6)[0:2]
-    e = np.dot(U.T, c.reshape((c.shape[0], np.product(c.shape[1:]))))
+    e = np.dot(U.T, c.reshape((c.shape[0], -1)))
     e.shape = (e.shape[0],) +  c.shape[1:]
 
     yield assert_almost_equal, phi(c, box1 + box2), phi(c, box1) + \
@@ -181,7 +181,7 @@ def test_lips3_disjoint():
     d = np.random.standard_normal((40,40,40,40))
 
     U = randorth(p=6)[0:3]
-    e = np.dot(U.T, c.reshape((c.shape[0], np.product(c.shape[1:]))))
+    e = np.dot(U.T, c.reshape((c.shape[0], -1)))
     e.shape = (e.shape[0],) +  c.shape[1:]
 
     yield assert_almost_equal, phi(c, box1 + box2), phi(c, box1) + phi(c, box2)
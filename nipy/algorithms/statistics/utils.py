@@ -219,7 +219,7 @@ def decompose3d(shape, dim=4):
                     yield [index+ii for ii in l]
 
     if dim == 1:
-        for i in range(np.product(shape)):
+        for i in range(np.prod(shape)):
             yield i
 
 
@@ -271,7 +271,7 @@ def decompose2d(shape, dim=3):
                     yield [index+ii for ii in l]
 
     if dim == 1:
-        for i in range(np.product(shape)):
+        for i in range(np.prod(shape)):
             yield i
 
 def test_EC3(shape):
@@ -0,0 +1,18 @@
+import numpy as np
+
+from nipy.testing import assert_true
+
+from nipy.algorithms.fwhm import Resels
+from nipy.core.reference.coordinate_map import Affine
+
+
+def test_resel_fwhm_roundtrip():
+    # non unit voxel sizes, so that wedge != 1
+    cmap = Affine.from_params('ijk', 'xyz', np.diag([2, 3, 4, 1]))
+    resels = Resels(cmap)
+    yield assert_true, not np.allclose(resels.wedge, 1)
+    r = np.array([0.5, 1., 2., 10.])
+    yield assert_true, np.allclose(resels.fwhm2resel(resels.resel2fwhm(r)), r)
+    fwhm = np.array([1., 5., 8.])
+    yield assert_true, np.allclose(resels.resel2fwhm(resels.fwhm2resel(fwhm)),
+                                   fwhm)
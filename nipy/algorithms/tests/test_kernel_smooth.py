@@ -66,7 +66,7 @@ def test_kernel():
         ssignal[:] *= kernel.norms[kernel.normalization]
 
         I = np.indices(ssignal.shape)
-        I.shape = (kernel.coordmap.ndim[0], np.product(shape))
+        I.shape = (kernel.coordmap.ndim[0], np.prod(shape))
         i, j, k = I[:,np.argmax(ssignal[:].flat)]
 
         yield assert_equal, (i,j,k), (ii,jj,kk)
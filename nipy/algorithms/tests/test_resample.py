@@ -5,6 +5,7 @@ from nipy.core.api import (Affine, Image,
                            ArrayCoordMap, compose)
 from nipy.core.reference import slices
 from nipy.algorithms.resample import resample, resample_img2img
+from nipy.algorithms.interpolation import ImageInterpolator
 from nipy.io.api import load_image
 
 from nose.tools import assert_true, assert_raises
@@ -22,6 +23,20 @@ def test_resample_img2img():
 
 
 
+def test_interpolator_dtype():
+    # Spline coefficients stored as float32 should give nearly the same
+    # values as the default float64 ones
+    cmap = Affine.from_params('ijk', 'xyz', np.diag([2,3,4,1]))
+    img = Image(np.random.standard_normal((10,12,8)), cmap)
+    points = np.random.uniform(0, 20, size=(3,50))
+    interp64 = ImageInterpolator(img)
+    interp32 = ImageInterpolator(img, dtype=np.float32)
+    yield assert_true, interp64.data.dtype == np.float64
+    yield assert_true, interp32.data.dtype == np.float32
+    yield assert_array_almost_equal, interp32.evaluate(points), \
+        interp64.evaluate(points), 5
+
+
 # Hackish flag for enabling of pylab plots of resamplingstest_2d_from_3d
 gui_review = False
 
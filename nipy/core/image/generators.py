@@ -229,7 +229,7 @@ def matrix_generator(img):
     
     """
     for i, r in img:
-        r.shape = (r.shape[0], product(r.shape[1:]))
+        r.shape = (r.shape[0], -1)
         yield i, r
 
 def shape_generator(img, shape):
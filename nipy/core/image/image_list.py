@@ -108,7 +108,95 @@ class ImageList(object):
 
         """
 
-        return np.asarray([np.asarray(im) for im in self.list])
+        try:
+            nimages = len(self.list)
+        except TypeError:
+            # self.list is an iterable without a length, such as an Image
+            return np.asarray([np.asarray(im) for im in self.list])
+        if nimages == 0:
+            return np.asarray([])
+        # Fill a single preallocated array rather than stacking a list of
+        # arrays, which would hold two copies of the data at once
+        v = None
+        for i, im in enumerate(self.list):
+            data = np.asarray(im)
+            if v is None:
+                v = np.empty((nimages,) + data.shape, data.dtype)
+            elif data.shape != v.shape[1:]:
+                raise ValueError('all images should have the same shape, '
+                                 'got %s and %s' % (v.shape[1:], data.shape))
+            elif data.dtype != v.dtype:
+                # upcast as stacking the arrays would have done
+                dtype = np.promote_types(v.dtype, data.dtype)
+                if dtype != v.dtype:
+                    v = v.astype(dtype)
+            v[i] = data
+        return v
+
+    def to_memmap(self, filename, dtype=None):
+        """Write the data to a memmap on disk, one image at a time.
+
+        Only one image is held in memory at any time, so this can be
+        used for lists that are too large to load with np.asarray.
+
+        Parameters
+        ----------
+        filename : str
+           name of the file backing the memmap, it is overwritten
+        dtype : None or numpy dtype, optional
+           dtype of the memmap.  The default is the type to which all
+           the image dtypes promote, as for np.asarray(self); finding it
+           takes an extra pass over the images.
+
+        Returns
+        -------
+        data : np.memmap
+           memmap with shape (number of images,) + image shape
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> import numpy as np
+        >>> from nipy.testing import funcfile
+        >>> from nipy.core.api import ImageList
+        >>> from nipy.io.api import load_image
+        >>> ilist = ImageList.from_image(load_image(funcfile))
+        >>> fd, fname = tempfile.mkstemp()
+        >>> data = ilist.to_memmap(fname)
+        >>> data.shape
+        (20, 17, 21, 3)
+        >>> del data
+        >>> os.close(fd)
+        >>> os.remove(fname)
+        """
+        images = self.list
+        try:
+            nimages = len(images)
+        except TypeError:
+            images = list(images)
+            nimages = len(images)
+        if nimages == 0:
+            raise ValueError('cannot write an empty ImageList')
+        if dtype is None:
+            # upcast as __array__ does, still one image at a time
+            for im in images:
+                im_dtype = np.asarray(im).dtype
+                if dtype is None:
+                    dtype = im_dtype
+                else:
+                    dtype = np.promote_types(dtype, im_dtype)
+        v = None
+        for i, im in enumerate(images):
+            data = np.asarray(im)
+            if v is None:
+                v = np.memmap(filename, dtype=dtype, mode='w+',
+                              shape=(nimages,) + data.shape)
+            elif data.shape != v.shape[1:]:
+                raise ValueError('all images should have the same shape, '
+                                 'got %s and %s' % (v.shape[1:], data.shape))
+            v[i] = data
+        v.flush()
+        return v
 
     def __iter__(self):
         self._iter = iter(self.list)
@@ -7,7 +7,6 @@ __docformat__ = 'restructuredtext'
 # FIXME: This module needs some attention. There are no unit tests for it
 # so it's hard to say whether it works correctly or not.
 
-import gc
 
 import numpy as np
 
@@ -219,8 +218,6 @@ class CoordinateMapROI(DiscreteROI):
 
         tmp = image.readall()
         v = [tmp[voxel] for voxel in self.voxels]
-
-        del(tmp); gc.collect()
         return v
         
     def __mul__(self, other):
@@ -329,9 +326,6 @@ def roi_ellipse_fn(center, form, a = 1.0):
         d = sum(X**2)
         d.shape = _shape[1:]
         value = np.less_equal(d, a)
-
-        del(_real); del(X); del(d)
-        gc.collect()
         return value
     return test
 
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import numpy as np
 
 from nipy.testing import funcfile, assert_true, assert_equal, assert_raises
@@ -43,3 +46,45 @@ def test_image_list():
     for x in sublist:
         yield assert_true, isinstance(x, Image)
         yield assert_equal, x.shape, func_shape[:3]
+
+
+def test_array_mixed():
+    cmap = load_image(funcfile)[...,0].coordmap
+    # The dtype is that of all the images stacked together
+    imglst = ImageList([Image(np.zeros((2,3,4), np.int16), cmap),
+                        Image(np.ones((2,3,4)) * 0.7, cmap)])
+    data = np.asarray(imglst)
+    yield assert_equal, data.dtype, np.dtype(np.float64)
+    yield assert_true, np.allclose(data[1], 0.7)
+    # Images of different shapes cannot be stacked
+    imglst = ImageList([Image(np.zeros((2,3,4)), cmap),
+                        Image(np.zeros((3,4)), cmap)])
+    yield assert_raises, ValueError, np.asarray, imglst
+
+
+def test_to_memmap():
+    img = load_image(funcfile)
+    imglst = ImageList.from_image(img)
+    fd, fname = tempfile.mkstemp()
+    try:
+        data = imglst.to_memmap(fname)
+        yield assert_equal, data.shape, np.asarray(imglst).shape
+        yield assert_true, np.allclose(data, np.asarray(imglst))
+        data = imglst.to_memmap(fname, dtype=np.float32)
+        yield assert_equal, data.dtype, np.dtype(np.float32)
+        del data
+        cmap = imglst[0].coordmap
+        badlst = ImageList([Image(np.zeros((2,3,4)), cmap),
+                            Image(np.zeros((3,4)), cmap)])
+        yield assert_raises, ValueError, badlst.to_memmap, fname
+        # the default dtype holds the values of all the images
+        mixlst = ImageList([Image(np.zeros((2,3), np.int16), cmap),
+                            Image(np.ones((2,3)) * 0.7, cmap)])
+        data = mixlst.to_memmap(fname)
+        yield assert_equal, data.dtype, np.dtype(np.float64)
+        yield assert_true, np.allclose(data[1], 0.7)
+        del data
+    finally:
+        os.close(fd)
+        os.remove(fname)
+    yield assert_raises, ValueError, ImageList().to_memmap, fname
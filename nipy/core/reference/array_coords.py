@@ -58,6 +58,8 @@ class ArrayCoordMap(object):
         values : array
            Values of self.coordmap evaluated at np.indices(self.shape).
         """
+        if isinstance(self.coordmap, Affine):
+            return self._evaluate_affine(transpose)
         indices = np.indices(self.shape).astype(
             self.coordmap.input_coords.coord_dtype)
         tmp_shape = indices.shape
@@ -69,6 +71,29 @@ class ArrayCoordMap(object):
             _range.shape = (_range.shape[0],) + tmp_shape[1:]
         return _range 
 
+    def _evaluate_affine(self, transpose=False):
+        """
+        As for ``_evaluate``, for an Affine coordmap.
+
+        The output is accumulated one input axis at a time from a
+        broadcast ``np.arange``, so the full grid of indices given by
+        np.indices(self.shape) is never built.
+        """
+        cmap = self.coordmap
+        A, b = cmap._A, cmap._b
+        dtype = cmap.output_coords.coord_dtype
+        ndim = len(self.shape)
+        _range = np.empty(self.shape + (cmap.ndim[1],), dtype=dtype)
+        _range[...] = b
+        for axis, n in enumerate(self.shape):
+            bshape = [1] * (ndim + 1)
+            bshape[axis] = n
+            idx = np.arange(n, dtype=cmap.input_coords.coord_dtype)
+            _range += idx.reshape(bshape) * A[:,axis]
+        if transpose:
+            return np.rollaxis(_range, -1)
+        return _range.reshape((-1, cmap.ndim[1]))
+
     def _getvalues(self):
         return self._evaluate(transpose=False)
     values = property(_getvalues, 
@@ -154,13 +154,20 @@ class CoordinateMap(object):
     def inverse(self):
         """
         Return a new CoordinateMap with the mappings reversed
+
+        The CoordinateMap is immutable, so the inverse is built on
+        first access and reused.
         """
         if self._inverse_mapping is None:
             return None
-        return CoordinateMap(self._inverse_mapping, 
-                             self._output_coords, 
-                             self._input_coords, 
-                             inverse_mapping=self._mapping)
+        inverse = getattr(self, '_inverse', None)
+        if inverse is None:
+            inverse = CoordinateMap(self._inverse_mapping, 
+                                    self._output_coords, 
+                                    self._input_coords, 
+                                    inverse_mapping=self._mapping)
+            self._inverse = inverse
+        return inverse
 
     @property
     def ndim(self):
@@ -222,10 +229,26 @@ class CoordinateMap(object):
 
         """
 
-        return CoordinateMap(self._mapping, 
-                             self._input_coords,
-                             self._output_coords, 
-                             inverse_mapping=self._inverse_mapping)
+        return _unchecked_coordmap(self._mapping, 
+                                   self._input_coords,
+                                   self._output_coords, 
+                                   inverse_mapping=self._inverse_mapping)
+
+
+def _unchecked_coordmap(mapping, input_coords, output_coords,
+                        inverse_mapping=None):
+    """Create a CoordinateMap without the trial evaluation of mapping.
+
+    For use when mapping is built from CoordinateMaps that have already
+    been checked, so that it is known to work with input_coords and
+    output_coords.
+    """
+    cmap = CoordinateMap.__new__(CoordinateMap)
+    cmap._mapping = mapping
+    cmap._input_coords = input_coords
+    cmap._output_coords = output_coords
+    cmap._inverse_mapping = inverse_mapping
+    return cmap
 
 class Affine(CoordinateMap):
     """
@@ -252,7 +275,7 @@ class Affine(CoordinateMap):
     array([[ 1.,  1.,  1.]])
     """
 
-    def __init__(self, affine, input_coords, output_coords):
+    def __init__(self, affine, input_coords, output_coords, dtype=None):
         """
         Return an CoordinateMap specified by an affine transformation
         in homogeneous coordinates.
@@ -265,16 +288,32 @@ class Affine(CoordinateMap):
            input coordinates
         output_coords : :class:`CoordinateSystem`
            output coordinates
+        dtype : None or numpy dtype, optional
+           dtype of the matrix and of both coordinate systems.  If None
+           (the default) it is determined as described below.
 
         Notes
         -----
-        The dtype of the resulting matrix is determined by finding a
-        safe typecast for the input_coords, output_coords and affine.
+        If dtype is None, the dtype of the resulting matrix is
+        determined by finding a safe typecast for the input_coords,
+        output_coords and affine.  Passing dtype=np.float32 keeps a
+        single precision pipeline in single precision, even if one of
+        the coordinate systems is float64.
+
+        >>> cm = Affine(np.identity(3), CoordinateSystem('ij'),
+        ...             CoordinateSystem('xy'), dtype=np.float32)
+        >>> cm.affine.dtype
+        dtype('float32')
+        >>> cm.input_coords.coord_dtype
+        dtype('float32')
         """
         affine = np.asarray(affine)
-        dtype = safe_dtype(affine.dtype,
-                           input_coords.coord_dtype,
-                           output_coords.coord_dtype)
+        if dtype is None:
+            dtype = safe_dtype(affine.dtype,
+                               input_coords.coord_dtype,
+                               output_coords.coord_dtype)
+        else:
+            dtype = np.dtype(dtype)
         inaxes = input_coords.coord_names
         outaxes = output_coords.coord_names
         self._input_coords = CoordinateSystem(inaxes,
@@ -288,9 +327,12 @@ class Affine(CoordinateMap):
             raise ValueError('coordinate lengths do not match '
                              'affine matrix shape')
         self._affine = affine
-        A, b = affines.to_matrix_vector(affine)
+        # The matrix and vector parts are split from the affine once
+        # here, not on each use
+        self._A, self._b = affines.to_matrix_vector(affine)
+        AT, b = self._A.T, self._b
         def _mapping(x):
-            value = np.dot(x, A.T)
+            value = np.dot(x, AT)
             value += b
             return value
         self._mapping = _mapping
@@ -312,13 +354,24 @@ class Affine(CoordinateMap):
     def inverse(self):
         """
         Return the inverse coordinate map.
+
+        The inverse matrix is computed once and reused, unless the
+        affine has been modified in place since.  A new Affine is
+        returned on each access, because callers may modify it.
         """
-        try:
-            return Affine(np.linalg.inv(self.affine), 
-                          self.output_coords, 
-                          self.input_coords)
-        except np.linalg.linalg.LinAlgError:
-            pass
+        cached = getattr(self, '_inverse_cache', None)
+        if cached is None or np.any(cached[0] != self._affine):
+            try:
+                inv = np.linalg.inv(self.affine)
+            except np.linalg.linalg.LinAlgError:
+                inv = None
+            cached = (self._affine.copy(), inv)
+            self._inverse_cache = cached
+        if cached[1] is None:
+            return None
+        return Affine(cached[1].copy(), 
+                      self.output_coords, 
+                      self.input_coords)
 
     @staticmethod
     def from_params(innames, outnames, params):
@@ -459,6 +512,47 @@ class Affine(CoordinateMap):
         return Affine(self._affine.copy(), self._input_coords,
                       self._output_coords)
 
+    def apply_separate(self, *coords):
+        """
+        Map points given as one array per input coordinate.
+
+        This avoids stacking the coordinates into a single (N, ndim)
+        array when they are already held as separate arrays, for
+        example the x, y and z of a point cloud.
+
+        Parameters
+        ----------
+        coords : ndim[0] arrays
+           values of each input coordinate, all of the same shape (or
+           broadcastable against each other)
+
+        Returns
+        -------
+        values : tuple of ndim[1] arrays
+           values of each output coordinate
+
+        Examples
+        --------
+        >>> cm = Affine(np.diag([1, 2, 3, 1]), CoordinateSystem('ijk'),
+        ...             CoordinateSystem('xyz'))
+        >>> x, y, z = cm.apply_separate([1, 2], [1, 2], [1, 2])
+        >>> x, y, z
+        (array([ 1.,  2.]), array([ 2.,  4.]), array([ 3.,  6.]))
+        """
+        if len(coords) != self.ndim[0]:
+            raise ValueError('expecting %d coordinate arrays' % self.ndim[0])
+        # broadcast first so that the in place sums below have the full
+        # shape from the start
+        coords = np.broadcast_arrays(*coords)
+        values = []
+        for i in range(self.ndim[1]):
+            value = self._A[i,0] * coords[0]
+            for j in range(1, self.ndim[0]):
+                value += self._A[i,j] * coords[j]
+            value += self._b[i]
+            values.append(value)
+        return tuple(values)
+
 
 def reorder_input(coordmap, order=None):
     """
@@ -488,20 +582,21 @@ def reorder_input(coordmap, order=None):
     ndim = coordmap.ndim[0]
     if order is None:
         order = range(ndim)[::-1]
-    elif type(order[0]) == type(''):
+    elif isinstance(order[0], basestring):
         order = [coordmap.input_coords.index(s) for s in order]
 
     newaxes = [coordmap.input_coords.coord_names[i] for i in order]
     newincoords = CoordinateSystem(newaxes, 
                                    coordmap.input_coords.name + '-reordered', 
                                    coord_dtype=coordmap.input_coords.coord_dtype)
-    perm = np.zeros((ndim+1,)*2)
-    perm[-1,-1] = 1.
-
-    for i, j in enumerate(order):
-        perm[j,i] = 1.
-
-    perm = perm.astype(coordmap.input_coords.coord_dtype)
+    if isinstance(coordmap, Affine):
+        # Reordering the inputs permutes the columns of the affine
+        affine = coordmap.affine[:,list(order) + [ndim]]
+        return Affine(affine, newincoords, coordmap.output_coords)
+
+    perm = np.zeros((ndim+1,)*2, coordmap.input_coords.coord_dtype)
+    perm[-1,-1] = 1
+    perm[list(order), range(ndim)] = 1
     A = Affine(perm, newincoords, coordmap.input_coords)
     return compose(coordmap, A)
 
@@ -542,19 +637,20 @@ def reorder_output(coordmap, order=None):
     ndim = coordmap.ndim[1]
     if order is None:
         order = range(ndim)[::-1]
-    elif type(order[0]) == type(''):
+    elif isinstance(order[0], basestring):
         order = [coordmap.output_coords.index(s) for s in order]
 
     newaxes = [coordmap.output_coords.coord_names[i] for i in order]
     newoutcoords = CoordinateSystem(newaxes, coordmap.output_coords.name + '-reordered', coordmap.output_coords.coord_dtype)
+    if isinstance(coordmap, Affine):
+        # Reordering the outputs permutes the rows of the affine
+        affine = coordmap.affine[list(order) + [ndim]]
+        return Affine(affine, coordmap.input_coords, newoutcoords)
     
-    perm = np.zeros((ndim+1,)*2)
-    perm[-1,-1] = 1.
-
-    for i, j in enumerate(order):
-        perm[j,i] = 1.
-
-    perm = perm.astype(coordmap.output_coords.coord_dtype)
+    perm = np.zeros((ndim+1,)*2, coordmap.output_coords.coord_dtype)
+    perm[-1,-1] = 1
+    # output i of the new coordmap is output order[i] of coordmap
+    perm[range(ndim), list(order)] = 1
     A = Affine(perm, coordmap.output_coords, newoutcoords)
     return compose(A, coordmap)
 
@@ -593,27 +689,31 @@ def product(*cmaps):
 
     def mapping(x):
         x = np.asarray(x)
-        y = []
-        for i in range(len(ndimin)-1):
-            cmap = cmaps[i]
-            if x.ndim == 2:
-                yy = cmaps[i](x[:,ndimin[i]:ndimin[i+1]])
-            else:
-                yy = cmaps[i](x[ndimin[i]:ndimin[i+1]])
-            y.append(yy)
-        yy = np.hstack(y)
-        return yy
-
-    notaffine = filter(lambda x: not isinstance(x, Affine), cmaps)
+        # The last axis holds the coordinates, whether x is one point or
+        # one point per row
+        y = [cmap(x[...,ndimin[i]:ndimin[i+1]])
+             for i, cmap in enumerate(cmaps)]
+        return np.hstack(y)
+
+    affine_only = all(isinstance(cmap, Affine) for cmap in cmaps)
 
     incoords = coordsys_product(*[cmap.input_coords for cmap in cmaps])
     outcoords = coordsys_product(*[cmap.output_coords for cmap in cmaps])
 
-    if not notaffine:
-
-        affine = linearize(mapping, ndimin[-1], dtype=incoords.coord_dtype)
+    if affine_only:
+        # The product of affines is block diagonal in the matrix part,
+        # so it is filled in directly rather than linearized
+        ndimout = [cmap.ndim[1] for cmap in cmaps]
+        ndimout.insert(0,0)
+        ndimout = tuple(np.cumsum(ndimout))
+        affine = np.zeros((ndimout[-1]+1, ndimin[-1]+1),
+                          dtype=incoords.coord_dtype)
+        for i, cmap in enumerate(cmaps):
+            affine[ndimout[i]:ndimout[i+1], ndimin[i]:ndimin[i+1]] = cmap._A
+            affine[ndimout[i]:ndimout[i+1], -1] = cmap._b
+        affine[-1,-1] = 1
         return Affine(affine, incoords, outcoords)
-    return CoordinateMap(mapping, incoords, outcoords)
+    return _unchecked_coordmap(mapping, incoords, outcoords)
 
 
 def compose(*cmaps):
@@ -647,35 +747,45 @@ def compose(*cmaps):
     """
 
     def _compose2(cmap1, cmap2):
-        forward = lambda input: cmap1.mapping(cmap2.mapping(input))
-        if cmap1.inverse is not None and cmap2.inverse is not None:
-            backward = lambda output: cmap2.inverse.mapping(cmap1.inverse.mapping(output))
+        # Look the mappings up once, not on every call of the composition
+        map1, map2 = cmap1.mapping, cmap2.mapping
+        forward = lambda input: map1(map2(input))
+        inverse1, inverse2 = cmap1.inverse, cmap2.inverse
+        if inverse1 is not None and inverse2 is not None:
+            invmap1, invmap2 = inverse1.mapping, inverse2.mapping
+            backward = lambda output: invmap2(invmap1(output))
         else:
             backward = None
         return forward, backward
 
+    affine_only = all(isinstance(cmap, Affine) for cmap in cmaps)
+
     cmap = cmaps[-1]
+    if affine_only:
+        # Compose the matrix and vector parts directly: exact, and no
+        # evaluation of the chained mappings
+        A, b = cmap._A, cmap._b
     for i in range(len(cmaps)-2,-1,-1):
         m = cmaps[i]
-        if m.input_coords == cmap.output_coords:
-            forward, backward = _compose2(m, cmap)
-            cmap = CoordinateMap(forward, 
-                                 cmap.input_coords, 
-                                 m.output_coords, 
-                                 inverse_mapping=backward)
-        else:
+        if m.input_coords != cmap.output_coords:
             raise ValueError(
                 'input and output coordinates do not match: '
                 'input=%s, output=%s' % 
                 (`m.input_coords.dtype`, `cmap.output_coords.dtype`))
-
-    notaffine = filter(lambda cmap: not isinstance(cmap, Affine), cmaps)
-    if not notaffine:
-        affine = linearize(cmap, 
-                           cmap.ndim[0], 
-                           dtype=cmap.output_coords.coord_dtype)
-        return Affine(affine, cmap.input_coords,
-                      cmap.output_coords)
+        if affine_only:
+            A, b = np.dot(m._A, A), np.dot(m._A, b) + m._b
+            cmap = m
+        else:
+            forward, backward = _compose2(m, cmap)
+            cmap = _unchecked_coordmap(forward, 
+                                       cmap.input_coords, 
+                                       m.output_coords, 
+                                       inverse_mapping=backward)
+
+    if affine_only:
+        return Affine(affines.from_matrix_vector(A, b),
+                      cmaps[-1].input_coords,
+                      cmaps[0].output_coords)
     return cmap
     
 
@@ -688,18 +798,29 @@ def replicate(coordmap, n, concataxis='concat'):
          coordmap : `CoordinateMap`
                 The coordmap to be used
          n : ``int``
-                The number of tiems to concatenate the coordmap
+                The number of times to concatenate the coordmap. A
+                CoordinateMap carries no shape, so n is only checked
+                to be a positive integer and is otherwise unused.
          concataxis : ``string``
                 The name of the new dimension formed by concatenation
-    """
 
-    raise NotImplementedError('The method this function depends on' 
-                              'no longer exists.')
+    The new axis is the first input and output coordinate, mapped by
+    the identity. If coordmap is an Affine, so is the result.
+
+    >>> cmap = Affine.from_params('ij', 'xy', np.diag([2,3,1]))
+    >>> rcmap = replicate(cmap, 10)
+    >>> rcmap.input_coords.coord_names
+    ('concat', 'i', 'j')
+    >>> rcmap.affine
+    array([[ 1.,  0.,  0.,  0.],
+           [ 0.,  2.,  0.,  0.],
+           [ 0.,  0.,  3.,  0.],
+           [ 0.,  0.,  0.,  1.]])
     """
-    concat = CoordinateMap.from_affine([concataxis], [concataxis], 
-                                       Affine(np.identity(2)), (n,))
+    if int(n) != n or n < 1:
+        raise ValueError('n should be a positive integer, got %s' % n)
+    concat = Affine.identity([concataxis])
     return product(concat, coordmap)
-    """
 
 
 def linearize(mapping, ndimin, step=1, origin=None, dtype=None):
@@ -749,15 +870,18 @@ def linearize(mapping, ndimin, step=1, origin=None, dtype=None):
             raise ValueError('origin.shape != (%d,)' % ndimin)
     b = mapping(origin)
 
-    origin = np.multiply.outer(np.ones(ndimin, dtype), origin)
-    y1 = mapping(step*np.eye(ndimin, dtype=dtype) + origin)
-    y0 = mapping(origin)
+    # One point per row: origin, stepped along each axis in turn.  Each
+    # row of mapping(origin) would just be b, so it is not evaluated.
+    points = np.empty((ndimin, ndimin), dtype)
+    points[:] = origin
+    points.flat[::ndimin+1] += step
+    y1 = mapping(points)
 
     ndimout = y1.shape[1]
-    C = np.zeros((ndimout+1, ndimin+1), (y0/step).dtype)
+    C = np.zeros((ndimout+1, ndimin+1), (y1[:1]/step).dtype)
     C[-1,-1] = 1
     C[:ndimout,-1] = b
-    C[:ndimout,:ndimin] = (y1 - y0).T / step
+    C[:ndimout,:ndimin] = (y1 - b).T / step
     return C
 
 
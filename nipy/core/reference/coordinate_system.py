@@ -134,7 +134,7 @@ class CoordinateSystem(object):
 
         """
 
-        return list(self.coord_names).index(coord_name)
+        return self._coord_names.index(coord_name)
 
     def __ne__(self, other):
         return not self.__eq__(other)
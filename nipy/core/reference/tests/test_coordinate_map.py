@@ -87,6 +87,7 @@ def test_inverse1():
     yield assert_true, inv(E.c) is None
     inv_b = E.b.inverse
     inv_d = E.d.inverse
+    yield assert_true, E.b.inverse is inv_b
     ident_b = compose(inv_b,E.b)
     ident_d = compose(inv_d,E.d)
     value = np.array([[1., 2., 3.]]).T    
@@ -212,6 +213,41 @@ def test_affine_copy():
     yield assert_equal, cmcp.output_coords, cm.output_coords
 
 
+def test_affine_inverse_cache():
+    incs, outcs, aff = affine_v2w()
+    cm = Affine(aff, incs, outcs)
+    inv = cm.inverse
+    yield assert_true, np.allclose(inv.affine, np.linalg.inv(aff))
+    # each access gives a new Affine, so editing one leaves cm intact
+    yield assert_false, cm.inverse is inv
+    inv.affine[0,3] = 100
+    yield assert_true, np.allclose(cm.inverse.affine, np.linalg.inv(aff))
+    yield assert_true, np.allclose(cm.inverse_mapping([[11,12,13]]),
+                                   [[0,0,0]])
+    # the inverse follows in place changes to the affine
+    cm.affine[0,0] = 3
+    aff[0,0] = 3
+    yield assert_true, np.allclose(cm.inverse.affine, np.linalg.inv(aff))
+    cm.affine[0,0] = 0
+    yield assert_true, cm.inverse is None
+
+
+def test_affine_apply_separate():
+    incs, outcs, aff = affine_v2w()
+    cm = Affine(aff, incs, outcs)
+    x = np.random.standard_normal((10,3))
+    values = cm.apply_separate(x[:,0], x[:,1], x[:,2])
+    yield assert_equal, len(values), 3
+    yield assert_true, np.allclose(np.array(values).T, cm(x))
+    yield assert_raises, ValueError, cm.apply_separate, x[:,0], x[:,1]
+    # coordinate arrays broadcast against each other
+    i, j = np.arange(3)[:,None], np.arange(4)[None,:]
+    values = cm.apply_separate(i, j, 1)
+    yield assert_equal, values[0].shape, (3, 4)
+    yield assert_true, np.allclose(values[2], aff[2,0]*i + aff[2,1]*j
+                                   + aff[2,2] + aff[2,3])
+
+
 #
 # Module level functions
 #
@@ -230,6 +266,11 @@ def test_reorder_input():
     # reorder with order as indices
     recm = reorder_input(cm, [2,0,1])
     yield assert_equal, recm.input_coords.coord_names, ('k', 'i', 'j')
+    # Affines reorder the columns of the affine
+    cm = Affine(np.diag([1,2,3,1]), incs, outcs)
+    recm = reorder_input(cm, 'jki')
+    yield assert_true, isinstance(recm, Affine)
+    yield assert_equal, recm([1,2,3]), cm([3,1,2])
 
 
 def test_reorder_output():
@@ -246,6 +287,14 @@ def test_reorder_output():
     # reorder with indicies
     recm = reorder_output(cm, [2,0,1])
     yield assert_equal, recm.output_coords.coord_names, ('z', 'x', 'y')    
+    # the values follow the names
+    x = np.array([[1,2,3]])
+    yield assert_equal, recm(x)[:,[1,2,0]], cm(x)
+    # Affines reorder the rows of the affine
+    cm = Affine(np.diag([1,2,3,1]), incs, outcs)
+    recm = reorder_output(cm, 'yzx')
+    yield assert_true, isinstance(recm, Affine)
+    yield assert_equal, recm([1,1,1]), [[2,3,1]]
 
 
 def test_product():
@@ -258,8 +307,21 @@ def test_product():
 
 
 def test_replicate():
-    # FIXME: Implement test when this function works
-    yield assert_raises, NotImplementedError, replicate, 'foo', 'bar'
+    cm = Affine.from_params('ij', 'xy', np.diag([2, 3, 1]))
+    rcm = replicate(cm, 5)
+    yield assert_equal, rcm.input_coords.coord_names, ('concat', 'i', 'j')
+    yield assert_equal, rcm.output_coords.coord_names, ('concat', 'x', 'y')
+    yield assert_equal, rcm.affine, np.diag([1, 2, 3, 1])
+    rcm = replicate(cm, 5, 't')
+    yield assert_equal, rcm.input_coords.coord_names, ('t', 'i', 'j')
+    # the concatenation axis cannot already be in coordmap
+    yield assert_raises, ValueError, replicate, cm, 5, 'i'
+    yield assert_raises, ValueError, replicate, cm, 0
+    yield assert_raises, ValueError, replicate, cm, 2.5
+    cm = CoordinateMap(lambda x: x + 1, CoordinateSystem('ij'),
+                       CoordinateSystem('xy'))
+    rcm = replicate(cm, 5)
+    yield assert_equal, rcm([[4, 1, 2]]), [[4, 2, 3]]
 
 
 def test_linearize():
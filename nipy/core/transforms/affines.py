@@ -62,8 +62,9 @@ def from_matrix_vector(matrix, vector):
     """
     
     nin, nout = matrix.shape
-    t = np.zeros((nin+1,nout+1), matrix.dtype)
+    t = np.empty((nin+1,nout+1), matrix.dtype)
     t[0:nin, 0:nout] = matrix
-    t[nin,   nout] = 1.
     t[0:nin, nout] = vector
+    t[nin,   0:nout] = 0
+    t[nin,   nout] = 1.
     return t
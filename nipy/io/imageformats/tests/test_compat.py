@@ -2,7 +2,7 @@
 ''' Tests for pynifti compat package '''
 import os
 import numpy as np
-import md5
+import hashlib
 import tempfile
 import shutil
 import unittest
@@ -23,13 +23,14 @@ data_shape = (2, 24, 96, 128)
 def md5sum(filename):
     """ Generate MD5 hash string.
     """
-    file = open( filename )
-    sum = md5.new()
+    file = open(filename, 'rb')
+    sum = hashlib.md5()
     while True:
-        data = file.read()
+        data = file.read(1 << 20)
         if not data:
             break
         sum.update(data)
+    file.close()
     return sum.hexdigest()
 
 
@@ -52,6 +52,7 @@ NIFTI input coordinates?)  For this reason, we have to consider whether
 we should transpose the memmap from nifti input.
 """
 import warnings
+import itertools
 
 import numpy as np
 
@@ -175,20 +176,19 @@ def coerce_coordmap(coordmap):
                       'transformation by reordering the output coordinates.')
         reoutput = True
     # Create the appropriate reorderings, if necessary
-    inperm = np.identity(ndim+1)
+    intrans = tuple(range(ndim))
+    incols = range(ndim)
     if reinput:
-        inperm[:ndim,:ndim] = np.array([[int(vinput[i] == innames[j]) 
-                                         for j in range(ndim)] 
-                                        for i in range(ndim)])
-    intrans = tuple(np.dot(inperm, range(ndim+1)).astype(np.int))[:-1]
-    outperm = np.identity(ndim+1)
+        intrans = tuple([list(innames).index(name) for name in vinput])
+        incols = [list(vinput).index(name) for name in innames]
+    outtrans = tuple(range(ndim))
     if reoutput:
-        outperm[:ndim,:ndim] = np.array([[int(voutput[i] == outnames[j]) 
-                                          for j in range(ndim)] 
-                                         for i in range(ndim)])
-    outtrans = tuple(np.dot(outperm, range(ndim+1)).astype(np.int))[:-1]
-    # Create the new affine
-    A = np.dot(outperm, np.dot(affine, inperm))
+        outtrans = tuple([list(outnames).index(name) for name in voutput])
+    # Create the new affine by reindexing the rows and columns of the
+    # old one, the last row and column stay in place. This is the
+    # product with the permutation matrices (outperm, inperm) where
+    # inperm[i,j] = (vinput[i] == innames[j]), without building them.
+    A = affine[list(outtrans) + [ndim]][:,list(incols) + [ndim]]
     # If the affine beyond the 3 coordinate is not diagonal
     # some information will be lost saving to NIFTI
     if not np.allclose(np.diag(np.diag(A))[3:,3:], A[3:,3:]):
@@ -196,11 +196,11 @@ def coerce_coordmap(coordmap):
                       "non 'ijk','xyz' coordinates, information "
                       "will be lost in saving to NIFTI")
     # Create new coordinate systems
-    if not np.allclose(inperm, np.identity(ndim+1)):
+    if intrans != tuple(range(ndim)):
         inname = coordmap.input_coords.name + '-reordered'
     else:
         inname = coordmap.input_coords.name
-    if not np.allclose(outperm, np.identity(ndim+1)):
+    if outtrans != tuple(range(ndim)):
         outname = coordmap.output_coords.name + '-reordered'
     else:
         outname = coordmap.output_coords.name
@@ -288,6 +288,15 @@ def ijk_from_fps(fps):
     >>> ijk_from_fps((2,None,0))
     'kji'
     '''
+    try:
+        return _IJK_FROM_FPS[tuple(fps)]
+    except (KeyError, TypeError):
+        # not a valid fps triple, let _ijk_from_fps raise the error
+        return _ijk_from_fps(fps)
+
+
+def _ijk_from_fps(fps):
+    ''' Compute ijk_from_fps(fps) without the lookup table '''
     remaining = []
     ijk = [' '] * 3
     for name, pos in zip('ijk', fps):
@@ -301,6 +310,18 @@ def ijk_from_fps(fps):
     return ''.join(ijk)
 
 
+# There are only a few valid frequency, phase, slice triples, so the
+# names for all of them are worked out once, at import
+_IJK_FROM_FPS = {}
+for _fps in itertools.product((None, 0, 1, 2), repeat=3):
+    try:
+        _IJK_FROM_FPS[_fps] = _ijk_from_fps(_fps)
+    except IndexError:
+        # two axes given the same position
+        pass
+del _fps
+
+
 def fps_from_ijk(ijk):
     ''' Get axis indices for frequency, phase, slice from ijk string
 
@@ -164,8 +164,7 @@ def estimateAR(resid, design, order=1):
                     
     invM = np.linalg.inv(M)
 
-    rresid = np.asarray(resid).reshape(resid.shape[0], 
-                                       np.product(resid.shape[1:]))
+    rresid = np.asarray(resid).reshape(resid.shape[0], -1)
     sum_sq = np.sum(rresid**2, axis=0)
 
     cov = np.zeros((p + 1,) + sum_sq.shape)
@@ -41,9 +41,9 @@ def estimate_pooled_covariance(resid, ARtarget=[0.3], mask=None):
     nvox = 0
     for i in range(resid.shape[1]):
         d = np.asarray(resid[:,i])
-        d.shape = (d.shape[0], np.product(d.shape[1:]))
+        d.shape = (d.shape[0], -1)
         keep = np.asarray(mask[i])
-        keep.shape = np.product(keep.shape)
+        keep.shape = -1
         d = d.compress(keep, axis=1)
         raw_sigma += np.dot(d, d.T)
         nvox += d.shape[1]
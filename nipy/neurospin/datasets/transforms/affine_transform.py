@@ -85,7 +85,7 @@ class AffineTransform(Transform):
             z: number or ndarray
                 The z coordinates
         """
-        return apply_affine(x, y, z, np.linalg.inv(self.affine))
+        return apply_affine(x, y, z, self._get_inverse_affine())
 
 
     def mapping(self, x, y, z):
@@ -107,6 +107,18 @@ class AffineTransform(Transform):
     # Private methods
     #---------------------------------------------------------------------------
 
+    def _get_inverse_affine(self):
+        """ Return the inverse of the affine, computed once and reused
+            unless the affine has been changed since.
+        """
+        cached = getattr(self, '_inverse_cache', None)
+        if cached is None or not np.all(cached[0] == self.affine):
+            affine = np.array(self.affine)
+            cached = (affine, np.linalg.inv(affine))
+            self._inverse_cache = cached
+        return cached[1]
+
+
     def __repr__(self):
         representation = \
                 '%s(\n  affine=%s,\n  input_space=%s,\n  output_space=%s)' % (
@@ -20,16 +20,16 @@ def apply_affine(x, y, z, affine):
     shape = x.shape
     assert y.shape == shape, 'Coordinate shapes are not equal'
     assert z.shape == shape, 'Coordinate shapes are not equal'
-    # Ravel, but avoiding a copy if possible
-    x = np.reshape(x, (-1,))
-    y = np.reshape(y, (-1,))
-    z = np.reshape(z, (-1,))
-    
-    in_coords = np.c_[x,
-                        y,
-                        z,
-                        np.ones(x.shape)].T
-    x, y, z, _ = np.dot(affine, in_coords)
+    # Fill a (3, N) array of coordinates: the row of ones of homogeneous
+    # coordinates is not needed, the translation is added afterwards
+    in_coords = np.empty((3, x.size))
+    in_coords[0] = np.reshape(x, (-1,))
+    in_coords[1] = np.reshape(y, (-1,))
+    in_coords[2] = np.reshape(z, (-1,))
+    A, b = to_matrix_vector(affine)
+    out_coords = np.dot(A, in_coords)
+    out_coords += b[:, np.newaxis]
+    x, y, z = out_coords
     x = np.reshape(x, shape)
     y = np.reshape(y, shape)
     z = np.reshape(z, shape)
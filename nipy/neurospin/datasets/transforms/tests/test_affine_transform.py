@@ -46,3 +46,18 @@ def test_misc():
     yield assert_equal, transform, copy.copy(transform)
     yield assert_equal, transform, copy.deepcopy(transform)
 
+
+def test_inverse_mapping_cache():
+    """ Check that the inverse mapping follows changes to the affine.
+    """
+    affine = np.eye(4)
+    transform = AffineTransform('in', 'out', affine)
+    x, y, z = np.random.random((3, 10))
+    yield np.testing.assert_almost_equal, transform.inverse_mapping(x, y, z), \
+                    (x, y, z)
+    affine[0, 0] = 2
+    yield np.testing.assert_almost_equal, transform.inverse_mapping(x, y, z), \
+                    (0.5*x, y, z)
+    transform.affine = np.diag([1, 4, 1, 1])
+    yield np.testing.assert_almost_equal, transform.inverse_mapping(x, y, z), \
+                    (x, 0.25*y, z)
@@ -11,6 +11,7 @@ import numpy as np
 from ..volume_grid import VolumeGrid
 from ..volume_img import VolumeImg
 from ...transforms.transform import Transform, CompositionError
+from ...transforms.affine_transform import AffineTransform
 
 def mapping(x, y, z):
     return 2*x, y, 0.5*z
@@ -114,6 +115,26 @@ def test_transformation():
             image2.get_data()
 
 
+def test_resampled_to_img_affine():
+    """ Check that resampling between affine grids, which is done in
+        voxel space, matches interpolating the world coordinates.
+    """
+    data = np.random.random((10, 12, 8))
+    affine = np.eye(4)
+    affine[:3, :3] = np.diag([2, 1, 1.5])
+    affine[:3, 3] = [-3, 4, 0.5]
+    img = VolumeGrid(data, AffineTransform('voxels', 'world', affine))
+    target_affine = np.eye(4)
+    target_affine[:3, :3] = [[1, 0.2, 0], [0, 1.1, 0], [0.1, 0, 0.9]]
+    target = VolumeImg(np.zeros((7, 9, 6)), target_affine, 'world')
+    resampled = img.resampled_to_img(target)
+    yield nose.tools.assert_true, isinstance(resampled, VolumeImg)
+    yield nose.tools.assert_equal, resampled.get_data().shape, (7, 9, 6)
+    x, y, z = target.get_world_coords()
+    yield np.testing.assert_almost_equal, resampled.get_data(), \
+                img.values_in_world(x, y, z)
+
+
 def test_as_volume_image():
     """ Test casting VolumeGrid to VolumeImg
     """
@@ -159,6 +159,21 @@ def test_eq():
                 np.eye(3, 3), 'mine'
 
 
+def test_get_transform():
+    """ Check that the transform follows changes to the affine.
+    """
+    affine = np.eye(4)
+    img = VolumeImg(np.random.random((2, 3, 4)), affine, 'mine')
+    transform = img.get_transform()
+    yield nose.tools.assert_true, img.get_transform() is transform
+    img.affine[0, 0] = 2
+    yield np.testing.assert_equal, img.get_transform().affine[0, 0], 2
+    img.affine = np.diag([1, 2, 3, 1])
+    yield np.testing.assert_equal, img.get_transform().affine, img.affine
+    img.world_space = 'other'
+    yield nose.tools.assert_equal, img.get_transform().output_space, 'other'
+
+
 def test_values_in_world():
     """ Test the evaluation of the data in world coordinate.
     """
@@ -110,9 +110,25 @@ class VolumeData(VolumeField):
             raise CompositionError(
                 "The two images are not embedded in the same world space")
         my_v2w_transform = self.get_transform()
-        x, y, z = target_image.get_world_coords()
-        new_data = self.values_in_world(x, y, z, 
-                                        interpolation=interpolation)
+        target_v2w_transform = target_image.get_transform()
+        if (hasattr(my_v2w_transform, 'affine') 
+                and hasattr(target_v2w_transform, 'affine')):
+            # Both grids are affine: resample in voxel space with
+            # ndimage.affine_transform, rather than going through the 
+            # world coordinates of every target voxel.
+            # We import late to avoid circular import
+            from .volume_img import VolumeImg
+            img = VolumeImg(self.get_data(), my_v2w_transform.affine,
+                            self.world_space, 
+                            interpolation=self.interpolation)
+            new_data = img.as_volume_img(
+                            affine=target_v2w_transform.affine,
+                            shape=target_image.get_data().shape[:3],
+                            interpolation=interpolation).get_data()
+        else:
+            x, y, z = target_image.get_world_coords()
+            new_data = self.values_in_world(x, y, z, 
+                                            interpolation=interpolation)
         new_img = target_image.like_from_data(new_data) 
         new_img.metadata = copy.copy(self.metadata)
         return new_img
@@ -154,15 +170,17 @@ class VolumeData(VolumeField):
 
     def __repr__(self):
         options = np.get_printoptions()
-        np.set_printoptions(precision=6, threshold=64, edgeitems=2)
-        representation = \
-                '%s(\n  data=%s,\n  world_space=%s,\n  interpolation=%s)' % (
-                self.__class__.__name__,
-                '\n       '.join(repr(self._data).split('\n')),
-                self.world_space,
-                self.interpolation,
-                )
-        np.set_printoptions(**options)
+        try:
+            np.set_printoptions(precision=6, threshold=64, edgeitems=2)
+            representation = \
+                    '%s(\n  data=%s,\n  world_space=%s,\n  interpolation=%s)' % (
+                    self.__class__.__name__,
+                    '\n       '.join(repr(self._data).split('\n')),
+                    self.world_space,
+                    self.interpolation,
+                    )
+        finally:
+            np.set_printoptions(**options)
         return representation
 
 
@@ -12,7 +12,7 @@ from scipy import ndimage
 
 # Local imports
 from .volume_data import VolumeData
-from ..transforms.affine_utils import apply_affine
+from ..transforms.affine_utils import apply_affine, to_matrix_vector
 
 ################################################################################
 # class `VolumeGrid`
@@ -137,8 +137,17 @@ class VolumeGrid(VolumeData):
                 z coordinates of the data points in world space
 
         """
-        x, y, z = np.indices(self._data.shape[:3])
-        return self.get_transform().mapping(x, y, z)
+        shape = self._data.shape[:3]
+        transform = self.get_transform()
+        if hasattr(transform, 'affine'):
+            # Broadcast an open grid through the affine, rather than
+            # building the full index arrays first
+            A, b = to_matrix_vector(transform.affine)
+            i, j, k = np.ix_(*[np.arange(n, dtype=np.float) for n in shape])
+            return tuple([A[d, 0]*i + A[d, 1]*j + A[d, 2]*k + b[d] 
+                          for d in range(3)])
+        x, y, z = np.indices(shape)
+        return transform.mapping(x, y, z)
 
 
     # XXX: The docstring should be inherited
@@ -214,6 +223,12 @@ class VolumeGrid(VolumeData):
         y = y.ravel()
         z = z.ravel()
         i, j, k = transform.inverse_mapping(x, y, z)
+        # One contiguous (3, N) array of voxel coordinates, shared by all
+        # the volumes below
+        coords = np.empty((3, x.size))
+        coords[0] = i
+        coords[1] = j
+        coords[2] = k
         data = self.get_data()
         data_shape = list(data.shape)
         n_dims = len(data_shape)
@@ -223,14 +238,14 @@ class VolumeGrid(VolumeData):
             # computational cost
             data = np.reshape(data, data_shape[:3] + [-1])
             data = np.rollaxis(data, 3)
-            values = [ ndimage.map_coordinates(slice, np.c_[i, j, k].T,
+            values = [ ndimage.map_coordinates(slice, coords,
                                                   order=interpolation_order)
                        for slice in data]
             values = np.array(values)
             values = np.swapaxes(values, 0, -1)
             values = np.reshape(values, shape + data_shape[3:])
         else:
-            values = ndimage.map_coordinates(data, np.c_[i, j, k].T,
+            values = ndimage.map_coordinates(data, coords,
                                         order=interpolation_order)
             values = np.reshape(values, shape)
         return values
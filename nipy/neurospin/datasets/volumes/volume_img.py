@@ -114,7 +114,15 @@ class VolumeImg(VolumeGrid):
 
 
     def get_transform(self):
-        return AffineTransform('voxel_space', self.world_space, self.affine)
+        # The transform holds a reference to self.affine, so it is reused
+        # until the affine or the world space are replaced
+        transform = getattr(self, '_transform_cache', None)
+        if (transform is None or transform.affine is not self.affine
+                or transform.output_space != self.world_space):
+            transform = AffineTransform('voxel_space', self.world_space,
+                                        self.affine)
+            self._transform_cache = transform
+        return transform
 
 
     # Inherit docstring
@@ -275,15 +283,17 @@ class VolumeImg(VolumeGrid):
 
     def __repr__(self):
         options = np.get_printoptions()
-        np.set_printoptions(precision=6, threshold=64, edgeitems=2)
-        representation = \
-                '%s(\n  data=%s,\n  affine=%s,\n  world_space=%s,\n  interpolation=%s)' % (
-                self.__class__.__name__,
-                '\n       '.join(repr(self._data).split('\n')),
-                '\n         '.join(repr(self.affine).split('\n')),
-                self.world_space,
-                self.interpolation)
-        np.set_printoptions(**options)
+        try:
+            np.set_printoptions(precision=6, threshold=64, edgeitems=2)
+            representation = \
+                    '%s(\n  data=%s,\n  affine=%s,\n  world_space=%s,\n  interpolation=%s)' % (
+                    self.__class__.__name__,
+                    '\n       '.join(repr(self._data).split('\n')),
+                    '\n         '.join(repr(self.affine).split('\n')),
+                    self.world_space,
+                    self.interpolation)
+        finally:
+            np.set_printoptions(**options)
         return representation
 
 
@@ -18,7 +18,9 @@ import sys
 # delayed, so that the part module can be used without them).
 import numpy as np
 import matplotlib as mp
-import pylab as pl
+# Only the colormaps are needed at import time: pylab (and the backend
+# it sets up) is imported in the plotting functions.
+import matplotlib.cm
 
 # Local imports
 from nipy.neurospin.utils.mask import compute_mask
@@ -83,29 +85,29 @@ def _pigtailed_cmap(cmap, name=None,
 # Using a dict as a namespace, to micmic matplotlib's cm
 
 _cm = dict(
-    cold_hot     = _pigtailed_cmap(pl.cm.hot,      name='cold_hot'),
-    brown_blue   = _pigtailed_cmap(pl.cm.bone,     name='brown_blue'),
-    cyan_copper  = _pigtailed_cmap(pl.cm.copper,   name='cyan_copper'),
-    cyan_orange  = _pigtailed_cmap(pl.cm.YlOrBr_r, name='cyan_orange'),
-    blue_red     = _pigtailed_cmap(pl.cm.Reds_r,   name='blue_red'),
-    brown_cyan   = _pigtailed_cmap(pl.cm.Blues_r,  name='brown_cyan'),
-    purple_green = _pigtailed_cmap(pl.cm.Greens_r, name='purple_green',
+    cold_hot     = _pigtailed_cmap(mp.cm.hot,      name='cold_hot'),
+    brown_blue   = _pigtailed_cmap(mp.cm.bone,     name='brown_blue'),
+    cyan_copper  = _pigtailed_cmap(mp.cm.copper,   name='cyan_copper'),
+    cyan_orange  = _pigtailed_cmap(mp.cm.YlOrBr_r, name='cyan_orange'),
+    blue_red     = _pigtailed_cmap(mp.cm.Reds_r,   name='blue_red'),
+    brown_cyan   = _pigtailed_cmap(mp.cm.Blues_r,  name='brown_cyan'),
+    purple_green = _pigtailed_cmap(mp.cm.Greens_r, name='purple_green',
                     swap_order=('red', 'blue', 'green')),
-    purple_blue  = _pigtailed_cmap(pl.cm.Blues_r, name='purple_blue',
+    purple_blue  = _pigtailed_cmap(mp.cm.Blues_r, name='purple_blue',
                     swap_order=('red', 'blue', 'green')),
-    blue_orange  = _pigtailed_cmap(pl.cm.Oranges_r, name='blue_orange',
+    blue_orange  = _pigtailed_cmap(mp.cm.Oranges_r, name='blue_orange',
                     swap_order=('green', 'red', 'blue')),
-    black_blue   = _rotate_cmap(pl.cm.hot, name='black_blue'),
-    black_purple = _rotate_cmap(pl.cm.hot, name='black_purple',
+    black_blue   = _rotate_cmap(mp.cm.hot, name='black_blue'),
+    black_purple = _rotate_cmap(mp.cm.hot, name='black_purple',
                                     swap_order=('blue', 'red', 'green')),
-    black_pink   = _rotate_cmap(pl.cm.hot, name='black_pink',
+    black_pink   = _rotate_cmap(mp.cm.hot, name='black_pink',
                             swap_order=('blue', 'green', 'red')),
-    black_green  = _rotate_cmap(pl.cm.hot, name='black_green',
+    black_green  = _rotate_cmap(mp.cm.hot, name='black_green',
                             swap_order=('red', 'blue', 'green')),
-    black_red    = pl.cm.hot,
+    black_red    = mp.cm.hot,
     )
 
-_cm.update(pl.cm.datad)
+_cm.update(mp.cm.datad)
 
 class _CM(dict):
     def __init__(self, *args, **kwargs):
@@ -167,6 +169,7 @@ def plot_map_2d(map, sform, cut_coords, anat=None, anat_sform=None,
         coordinates are (y, x, z), if (x, y, z) are in voxel-ordering
         convention.
     """
+    import pylab as pl
     if anat is None:
         anat, anat_sform, vmax_anat = _AnatCache.get_anat()
     elif anat is not False:
@@ -393,6 +396,7 @@ def plot_map(map, sform, cut_coords, anat=None, anat_sform=None,
         coordinates are (y, x, z), if (x, y, z) are in voxel-ordering
         convention.
     """
+    import pylab as pl
     try:
         from enthought.mayavi import version
         if not int(version.version[0]) > 2:
@@ -569,6 +573,7 @@ def plot_niftifile(filename, outputname=None, do3d=False, vmin=None,
         coordinates are (y, x, z), if (x, y, z) are in voxel-ordering
         convention.
     """
+    import pylab as pl
 
     if outputname is None:
         outputname = os.path.splitext(filename)[0] + '.png'
@@ -1,22 +1,39 @@
 version='0.1.2'
 release=False
 
+def _in_bzr_branch(path):
+    """ Return True if `path` or one of its parents holds a bzr branch
+    """
+    import os
+    path = os.path.abspath(path)
+    while True:
+        if os.path.isdir(os.path.join(path, '.bzr')):
+            return True
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False
+        path = parent
+
+
 if not release:
     have_revno = False
     try:
         import os
         import subprocess
         # Use bzr to get the revision number.  Execute bzr in the same
-        # directory as this file.
+        # directory as this file.  Only spawn bzr when there is a branch
+        # to ask, so installed copies do not pay for a subprocess on
+        # every import.
         dir = os.path.dirname(__file__)
-        proc = subprocess.Popen(['bzr', 'revno'], stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                cwd=dir)
-        revno, errcode = proc.communicate()
-        if revno:
-            revno = int(revno)
-            version += 'dev%d' % revno
-            have_revno = True
+        if _in_bzr_branch(dir):
+            proc = subprocess.Popen(['bzr', 'revno'], stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE,
+                                    cwd=dir)
+            revno, errcode = proc.communicate()
+            if revno:
+                revno = int(revno)
+                version += 'dev%d' % revno
+                have_revno = True
     except OSError:
         # Either bzr was not found or nipy was imported from a
         # directory that isn't a bzr branch.  Just ignore.